@@ -1,15 +1,40 @@
 from fastmcp import FastMCP
 from typing import List, Dict, Optional, Any
-import http.client
-import json
+from collections import OrderedDict
+from types import MappingProxyType
+from functools import lru_cache
+from contextlib import asynccontextmanager
+import asyncio
 import os
+import random
+import time
 import urllib.parse
 import logging
-import traceback
-import time
+import httpx
 from starlette.responses import JSONResponse
 
-# Configure logging
+# orjson parses bytes directly and is ~3x faster than stdlib json on typical
+# API payloads; fall back to stdlib if it isn't installed.
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# orjson.Fragment lets an already-serialized API body be spliced into the
+# outer result envelope without reparsing it; stdlib json has no equivalent.
+_HAS_FRAGMENT = hasattr(_json, "Fragment")
+
+def _serialize_tool_result(data: Any) -> str:
+    """Serializes tool results for the MCP layer, splicing pre-serialized
+    response bodies (orjson Fragments) verbatim instead of reparsing them."""
+    if _HAS_FRAGMENT:
+        return _json.dumps(data, default=str).decode("utf-8")
+    return _json.dumps(data, default=str)
+
+# Configure logging. This stays at module scope on purpose: the container
+# runs `uvicorn main:app`, which imports this module without executing the
+# __main__ block, so a guarded basicConfig would never run in deployment and
+# all INFO logs would be lost.
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -17,7 +42,7 @@ logging.basicConfig(
 logger = logging.getLogger('quora_api_tools')
 
 # Create MCP server
-mcp = FastMCP("QuoraProfiler", stateless_http=True)
+mcp = FastMCP("QuoraProfiler", stateless_http=True, tool_serializer=_serialize_tool_result)
 
 app = mcp.http_app(path="/quora")
 
@@ -29,8 +54,182 @@ async def alive(request):
 QUORA_API_KEY = os.environ.get("QUORA_API_KEY", "xxxx")
 QUORA_API_HOST = os.environ.get("QUORA_API_HOST", "quora-scraper.p.rapidapi.com")
 
+# Canonical Quora API headers, built once and shared read-only by every
+# request instead of being recreated per call
+QUORA_HEADERS = MappingProxyType({
+    "Content-Type": "application/json",
+    "Connection": "keep-alive",
+    "x-rapidapi-host": QUORA_API_HOST,
+    "x-rapidapi-key": QUORA_API_KEY
+})
+
+# Prebuilt base URL; per-call targets are spliced in as already-encoded raw
+# paths so httpx doesn't re-parse the URL on every request
+_BASE_URL = httpx.URL(f"https://{QUORA_API_HOST}")
+
+# Shared async HTTP client. Every tool hits the same host, so one client with
+# a keep-alive connection pool serves all concurrent tool calls without paying
+# a TCP + TLS handshake per request.
+_SESSION: Optional[httpx.AsyncClient] = None
+_SESSION_LOCK = asyncio.Lock()
+
+async def _get_session() -> httpx.AsyncClient:
+    """Returns the shared HTTP client, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        async with _SESSION_LOCK:
+            if _SESSION is None:
+                # http2 lets concurrent tool calls multiplex over one TLS
+                # connection instead of queueing on an HTTP/1.1 socket; the
+                # fixed API headers live on the client so requests that use
+                # them skip the per-call header merge
+                _SESSION = httpx.AsyncClient(
+                    base_url=_BASE_URL,
+                    http2=True,
+                    headers=dict(QUORA_HEADERS),
+                    timeout=httpx.Timeout(30.0),
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+                )
+    return _SESSION
+
+async def _prewarm():
+    """Issues one throwaway request through the shared client at startup.
+
+    This resolves DNS and completes the TCP + TLS handshake on a connection
+    that stays in the client's keep-alive pool, so the first real tool call
+    reuses it instead of paying the cold-start cost.
+    """
+    try:
+        session = await _get_session()
+        res = await session.get("/")
+        logger.info("Prewarmed connection to %s (status %s)", QUORA_API_HOST, res.status_code)
+    except Exception as e:
+        # Best effort -- the first real request simply pays the handshake
+        logger.debug("Prewarm failed: %s", e)
+
+# Chain the MCP server's lifespan and kick off prewarming in the background
+# once the event loop is up, without delaying startup
+_mcp_lifespan = app.router.lifespan_context
+
+@asynccontextmanager
+async def _lifespan(app):
+    async with _mcp_lifespan(app):
+        prewarm_task = asyncio.create_task(_prewarm())
+        try:
+            yield
+        finally:
+            prewarm_task.cancel()
+
+app.router.lifespan_context = _lifespan
+
+# All tools are read-only GETs keyed entirely by their arguments, so repeated
+# identical queries (common when an agent re-asks for the same page) can be
+# answered from a short-lived in-process cache without a network round trip.
+QUORA_CACHE_TTL = float(os.environ.get("QUORA_CACHE_TTL", "300"))
+
+class _TTLCache:
+    """Minimal TTL-bounded LRU cache for tool results."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value: Dict[str, Any]):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+_TOOL_CACHE = _TTLCache(maxsize=1024, ttl=QUORA_CACHE_TTL)
+
+# In-flight identical requests are coalesced onto one Future so N concurrent
+# callers of the same query cost a single network round trip ("singleflight");
+# this also closes the race where the TTL cache hasn't been populated yet.
+_INFLIGHT: Dict[tuple, asyncio.Future] = {}
+
+# Retry policy for make_api_request
+MAX_RETRIES = 3
+RETRY_DELAY = 2  # seconds
+
+def _is_retryable(status: int) -> bool:
+    """Returns True for statuses that indicate a transient upstream condition
+    (throttling or a gateway blip) rather than a caller error."""
+    return status in (429, 502, 503, 504)
+
+def _retry_wait(attempt: int, retry_after: str = None) -> float:
+    """Returns the delay before the next retry attempt.
+
+    Exponential backoff with full jitter, so concurrent clients don't retry
+    in lockstep and re-trigger upstream rate limits; an explicit Retry-After
+    from the API takes precedence.
+    """
+    if retry_after:
+        try:
+            return min(30.0, float(retry_after))
+        except ValueError:
+            pass
+    return min(30.0, (2 ** attempt) * RETRY_DELAY) * random.random()
+
+# Bodies larger than this are streamed into a preallocated buffer instead of
+# being accumulated as a chunk list and joined, which would briefly hold two
+# copies of the payload in memory. 64KB matches the transport's chunk size:
+# anything smaller arrives in one chunk and needs no join anyway.
+_STREAM_THRESHOLD = 64 * 1024  # bytes
+
+async def _read_body(res: httpx.Response) -> bytes | bytearray:
+    """Reads a streamed response body.
+
+    Large bodies with a known Content-Length are received straight into a
+    pre-sized bytearray; small or compressed bodies use the regular read
+    path. The returned buffer feeds the JSON parser without another copy.
+    """
+    try:
+        content_length = int(res.headers.get("Content-Length", 0))
+    except ValueError:
+        content_length = 0
+
+    # Content-Length describes the wire size, not the decompressed body, so
+    # compressed responses can't be pre-sized reliably.
+    if content_length <= _STREAM_THRESHOLD or res.headers.get("Content-Encoding"):
+        return await res.aread()
+
+    buf = bytearray(content_length)
+    view = memoryview(buf)
+    received = 0
+    async for chunk in res.aiter_bytes():
+        end = received + len(chunk)
+        if end > len(buf):
+            # Body larger than advertised; grow the buffer
+            view.release()
+            buf.extend(bytes(end - len(buf)))
+            view = memoryview(buf)
+        view[received:end] = chunk
+        received = end
+    view.release()
+    if received < len(buf):
+        del buf[received:]
+    return buf
+
+@lru_cache(maxsize=512)
+def _encode_params(items: tuple) -> str:
+    """Urlencodes a sorted parameter tuple, cached because the same small
+    enum-valued parameter sets (language, sort, time filters) recur often."""
+    return urllib.parse.urlencode(items)
+
 # Helper function for making API requests with error handling
-def make_api_request(method: str, endpoint: str, params: Dict = None, headers: Dict = None) -> Dict[str, Any]:
+async def make_api_request(method: str, endpoint: str, params: Dict = None, headers: Dict = None, verbatim: bool = True, query_string: str = None) -> Dict[str, Any]:
     """
     Makes an API request with error handling.
     
@@ -39,70 +238,151 @@ def make_api_request(method: str, endpoint: str, params: Dict = None, headers: D
         endpoint: API endpoint
         params: Query parameters (for GET)
         headers: Request headers
+        verbatim: Forward successful JSON bodies as pre-serialized fragments
+            instead of parsing them (callers that need to inspect the data
+            should pass False)
+        query_string: Pre-encoded query string including the leading "?";
+            when given, params is ignored
         
     Returns:
         API response as a dictionary
     """
-    MAX_RETRIES = 3
-    RETRY_DELAY = 2  # seconds
-    
     # Ensure headers are set
     if headers is None:
-        headers = {
-            "Content-Type": "application/json",
-            "x-rapidapi-host": QUORA_API_HOST,
-            "x-rapidapi-key": QUORA_API_KEY
-        }
-    
-    # Build query string for GET requests
-    query_string = ""
-    if params and method == "GET":
-        query_string = "?" + urllib.parse.urlencode(params)
+        headers = QUORA_HEADERS
     
-    # Log the request details (without sensitive info)
-    sanitized_headers = {k: v for k, v in headers.items() if k.lower() not in ['x-rapidapi-key', 'authorization']}
-    logger.info(f"API Request: {method} {endpoint}{query_string}")
-    logger.debug(f"Headers: {sanitized_headers}")
-    if params and method == "GET":
-        logger.debug(f"Params: {params}")
+    # Build query string for GET requests unless the caller already encoded
+    # one. Short all-string param sets are encoded through the memoized
+    # helper; long unique values (search queries, question URLs) would only
+    # churn the cache and are encoded directly.
+    if query_string is None:
+        query_string = ""
+        if params and method == "GET":
+            items = tuple(sorted(params.items()))
+            if all(isinstance(v, str) for _, v in items) and sum(len(v) for _, v in items) <= 64:
+                query_string = "?" + _encode_params(items)
+            else:
+                query_string = "?" + urllib.parse.urlencode(params)
     
+    # Log the request details (without sensitive info); the sanitized header
+    # dict is only built when DEBUG logging is actually enabled.
+    logger.info("API Request: %s %s%s", method, endpoint, query_string)
+    if logger.isEnabledFor(logging.DEBUG):
+        sanitized_headers = {k: v for k, v in headers.items() if k.lower() not in ('x-rapidapi-key', 'authorization')}
+        logger.debug("Headers: %s", sanitized_headers)
+        if params and method == "GET":
+            logger.debug("Params: %s", params)
+
+    # Coalesce concurrent identical requests onto the first caller's Future.
+    # Headers are not part of the key, so only requests using the canonical
+    # header set participate; custom headers must not share another caller's
+    # response.
+    if headers is not QUORA_HEADERS:
+        return await _perform_request(method, endpoint, query_string, headers, verbatim)
+
+    key = (method, endpoint, query_string, verbatim)
+    future = _INFLIGHT.get(key)
+    if future is not None:
+        logger.debug("Joining in-flight request: %s %s%s", method, endpoint, query_string)
+        return await asyncio.shield(future)
+
+    future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = future
+    try:
+        result = await _perform_request(method, endpoint, query_string, headers, verbatim)
+        future.set_result(result)
+        return result
+    finally:
+        _INFLIGHT.pop(key, None)
+        if not future.done():
+            future.cancel()
+
+async def _perform_request(method: str, endpoint: str, query_string: str, headers: Dict, verbatim: bool = True) -> Dict[str, Any]:
+    """Performs one API request with retries; the workhorse behind
+    make_api_request."""
     for attempt in range(MAX_RETRIES):
         try:
-            # Create connection
-            conn = http.client.HTTPSConnection(QUORA_API_HOST)
-            
-            # Set timeout to prevent hanging requests
-            conn.timeout = 30
-            
-            # Make request
-            conn.request(method, endpoint + query_string, None, headers)
-            
-            # Get response
-            res = conn.getresponse()
-            data = res.read().decode("utf-8")
-            
+            # Issue the request on the shared client; the pool transparently
+            # reuses (and replaces) keep-alive connections. The response is
+            # streamed so large bodies can be read into a pre-sized buffer.
+            session = await _get_session()
+            url = _BASE_URL.copy_with(raw_path=(endpoint + query_string).encode("ascii"))
+            req = session.build_request(
+                method, url,
+                headers=None if headers is QUORA_HEADERS else headers
+            )
+            res = await session.send(req, stream=True)
+            try:
+                data = await _read_body(res)
+            finally:
+                await res.aclose()
+
             # Log response status
-            logger.info(f"API Response: {method} {endpoint}{query_string} - Status: {res.status}")
+            logger.info("API Response: %s %s%s - Status: %s", method, endpoint, query_string, res.status_code)
             
             # Parse response
             if data:
+                content_type = res.headers.get("Content-Type", "")
+
+                # Error bodies from upstream proxies are often HTML or plain
+                # text; don't burn a doomed JSON parse and its exception on
+                # them, just report a bounded snippet
+                if res.status_code >= 400 and "json" not in content_type:
+                    snippet = data[:200].decode("utf-8", "replace")
+                    logger.error("API Error: %s %s%s - Status: %s - Body: %s", method, endpoint, query_string, res.status_code, snippet)
+
+                    if _is_retryable(res.status_code) and attempt < MAX_RETRIES - 1:
+                        retry_wait = _retry_wait(attempt, res.headers.get("Retry-After"))
+                        logger.info("Retrying in %.1f seconds... (Attempt %s/%s)", retry_wait, attempt + 1, MAX_RETRIES)
+                        await asyncio.sleep(retry_wait)
+                        continue
+
+                    return {
+                        "success": False,
+                        "status": res.status_code,
+                        "message": f"HTTP {res.status_code} error from API",
+                        "details": {"raw_data": snippet}
+                    }
+
+                # On success the body is forwarded to the client as-is, so
+                # parsing it here only to re-serialize it is wasted work:
+                # splice the raw bytes into the envelope as a fragment.
+                if (verbatim and _HAS_FRAGMENT and res.status_code < 400
+                        and "json" in content_type):
+                    # Fragment requires bytes; only buffered large bodies
+                    # (bytearray) pay a conversion here
+                    if not isinstance(data, bytes):
+                        data = bytes(data)
+                    return {
+                        "success": True,
+                        "status": res.status_code,
+                        "data": _json.Fragment(data)
+                    }
                 try:
-                    response_data = json.loads(data)
+                    response_data = _json.loads(data)
                     
                     # Log partial response for debugging
-                    if isinstance(response_data, dict):
-                        log_keys = list(response_data.keys())
-                        logger.debug(f"Response keys: {log_keys}")
+                    if isinstance(response_data, dict) and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Response keys: %s", list(response_data.keys()))
                     
                     # Check for API errors in response
-                    if res.status >= 400:
+                    if res.status_code >= 400:
                         error_msg = response_data.get('message', 'Unknown API error')
-                        logger.error(f"API Error: {method} {endpoint}{query_string} - Status: {res.status} - Error: {error_msg}")
-                        
+                        logger.error("API Error: %s %s%s - Status: %s - Error: %s", method, endpoint, query_string, res.status_code, error_msg)
+
+                        # Transient throttling/outage: retry after the delay
+                        # the API asked for (or jittered backoff) instead of
+                        # failing immediately
+                        if _is_retryable(res.status_code) and attempt < MAX_RETRIES - 1:
+                            retry_wait = _retry_wait(attempt, res.headers.get("Retry-After"))
+                            logger.info("Retrying in %.1f seconds... (Attempt %s/%s)", retry_wait, attempt + 1, MAX_RETRIES)
+                            await asyncio.sleep(retry_wait)
+                            continue
+
                         # Return error response
                         return {
                             "success": False,
-                            "status": res.status,
+                            "status": res.status_code,
                             "message": error_msg,
                             "details": response_data
                         }
@@ -110,37 +390,41 @@ def make_api_request(method: str, endpoint: str, params: Dict = None, headers: D
                     # Return successful response
                     return {
                         "success": True,
-                        "status": res.status,
+                        "status": res.status_code,
                         "data": response_data
                     }
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON Decode Error: {method} {endpoint}{query_string} - {str(e)}")
-                    logger.error(f"Raw response: {data[:200]}..." if len(data) > 200 else f"Raw response: {data}")
-                    
+                except ValueError as e:
+                    # Covers both json.JSONDecodeError and orjson.JSONDecodeError
+                    raw_text = data[:1000].decode("utf-8", "replace")
+                    logger.error("JSON Decode Error: %s %s%s - %s", method, endpoint, query_string, e)
+                    logger.error("Raw response: %s%s", raw_text[:200], "..." if len(data) > 200 else "")
+
                     # Return error response
                     return {
                         "success": False,
-                        "status": res.status,
+                        "status": res.status_code,
                         "message": "Failed to decode JSON response",
-                        "details": {"error": str(e), "raw_data": data[:1000] if len(data) > 1000 else data}
+                        "details": {"error": str(e), "raw_data": raw_text}
                     }
             else:
-                logger.warning(f"Empty response: {method} {endpoint}{query_string}")
+                logger.warning("Empty response: %s %s%s", method, endpoint, query_string)
                 return {
                     "success": False,
-                    "status": res.status,
+                    "status": res.status_code,
                     "message": "Empty response from API"
                 }
                 
         except Exception as e:
-            logger.error(f"Request Error: {method} {endpoint}{query_string} - {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            
+            # Formatting a traceback walks every frame and reads source files;
+            # keep it off the retry hot path and only emit it at DEBUG level.
+            logger.error("Request Error: %s %s%s - %s", method, endpoint, query_string, e)
+            logger.debug("Traceback:", exc_info=True)
+
             # Check if we should retry
             if attempt < MAX_RETRIES - 1:
-                retry_wait = RETRY_DELAY * (attempt + 1)
-                logger.info(f"Retrying in {retry_wait} seconds... (Attempt {attempt + 1}/{MAX_RETRIES})")
-                time.sleep(retry_wait)
+                retry_wait = _retry_wait(attempt)
+                logger.info("Retrying in %.1f seconds... (Attempt %s/%s)", retry_wait, attempt + 1, MAX_RETRIES)
+                await asyncio.sleep(retry_wait)
             else:
                 # Return error response after all retries failed
                 return {
@@ -149,11 +433,7 @@ def make_api_request(method: str, endpoint: str, params: Dict = None, headers: D
                     "message": f"Request failed after {MAX_RETRIES} attempts",
                     "details": {"error": str(e)}
                 }
-        finally:
-            # Close connection
-            if 'conn' in locals():
-                conn.close()
-    
+
     # This should never be reached due to the return in the last retry attempt
     return {
         "success": False,
@@ -161,141 +441,177 @@ def make_api_request(method: str, endpoint: str, params: Dict = None, headers: D
         "message": "Unexpected error in API request"
     }
 
-# Quora API headers
-QUORA_HEADERS = {
-    "Content-Type": "application/json",
-    "x-rapidapi-host": QUORA_API_HOST,
-    "x-rapidapi-key": QUORA_API_KEY
-}
-
 # Quora API Tools based on quora_apis.jsonl
+#
+# The tools differ only in endpoint and in which optional parameters they
+# accept, so they are generated from a declarative table. The shared body
+# (cache lookup, param-dict construction, error handling) lives in a single
+# code object instead of five hand-copied wrappers.
 
-# Tool: Search Questions
-@mcp.tool()
-def search_questions(query: str, language: str, cursor: str = None, time: str = None) -> Dict:
-    """Search for Questions Across Quora
+# (endpoint name, docstring, required params, optional params)
+_TOOL_SPECS = [
+    ("search_questions",
+     """Search for Questions Across Quora
     
     Get Request Parameters:
     - query: Search query (paramType: STRING, required) (e.g., "cars")
     - language: Language filter (paramType: ENUM, required)
     - cursor: Pagination cursor (paramType: STRING, optional)
     - time: Time filter (paramType: ENUM, optional)
-    """
-    try:
-        params = {
-            "query": query,
-            "language": language
-        }
-        
-        if cursor:
-            params["cursor"] = cursor
-            
-        if time:
-            params["time"] = time
-            
-        return make_api_request("GET", "/search_questions", params, QUORA_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in search_questions tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Search Answers
-@mcp.tool()
-def search_answers(query: str, language: str, cursor: str = None, time: str = None) -> Dict:
-    """Search for Answers Across Quora
+    """,
+     ("query", "language"), ("cursor", "time")),
+    ("search_answers",
+     """Search for Answers Across Quora
     
     Get Request Parameters:
     - query: Search query (paramType: STRING, required) (e.g., "cars")
     - language: Language filter (paramType: ENUM, required)
     - cursor: Pagination cursor (paramType: STRING, optional)
     - time: Time filter (paramType: ENUM, optional)
-    """
-    try:
-        params = {
-            "query": query,
-            "language": language
-        }
-        
-        if cursor:
-            params["cursor"] = cursor
-            
-        if time:
-            params["time"] = time
-            
-        return make_api_request("GET", "/search_answers", params, QUORA_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in search_answers tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Search Profiles
-@mcp.tool()
-def search_profiles(query: str, language: str, cursor: str = None) -> Dict:
-    """Search for User Profiles Across Quora
+    """,
+     ("query", "language"), ("cursor", "time")),
+    ("search_profiles",
+     """Search for User Profiles Across Quora
     
     Get Request Parameters:
     - query: Search query (paramType: STRING, required) (e.g., "cars")
     - language: Language filter (paramType: ENUM, required)
     - cursor: Pagination cursor (paramType: STRING, optional)
-    """
-    try:
-        params = {
-            "query": query,
-            "language": language
-        }
-        
-        if cursor:
-            params["cursor"] = cursor
-            
-        return make_api_request("GET", "/search_profiles", params, QUORA_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in search_profiles tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Get Answers From Question
-@mcp.tool()
-def question_answers(url: str, cursor: str = None, sort: str = None) -> Dict:
-    """Get Answers for a Specific Question
+    """,
+     ("query", "language"), ("cursor",)),
+    ("question_answers",
+     """Get Answers for a Specific Question
     
     Get Request Parameters:
     - url: Quora question URL (paramType: STRING, required) (e.g., "https://www.quora.com/Does-China-have-cars")
     - cursor: Pagination cursor (paramType: STRING, optional)
     - sort: Sort order (paramType: ENUM, optional)
+    """,
+     ("url",), ("cursor", "sort")),
+    ("question_comments",
+     """Get Comments for a Specific Question
+    
+    Get Request Parameters:
+    - url: Quora question URL (paramType: STRING, required) (e.g., "https://www.quora.com/Does-China-have-cars")
+    - cursor: Pagination cursor (paramType: STRING, optional)
+    """,
+     ("url",), ("cursor",)),
+]
+
+# Used by the generated tool bodies to encode individual parameter values
+_quote = urllib.parse.quote_plus
+
+def _make_tool(name: str, doc: str, required: tuple, optional: tuple):
+    """Compiles one async tool function from its endpoint spec.
+
+    A real `def` with the right signature is generated so FastMCP derives the
+    correct parameter schema for each tool. The query string is assembled from
+    literals partially evaluated at import time -- each tool's endpoint and
+    parameter names are static, so only the values are encoded per call.
     """
+    signature = ", ".join(
+        [f"{p}: str" for p in required] + [f"{p}: str = None" for p in optional]
+    )
+    all_params = required + optional
+    required_expr = " + ".join(
+        f'"{"?" if i == 0 else "&"}{p}=" + _quote({p})' for i, p in enumerate(required)
+    )
+    optional_lines = "\n".join(
+        f'        if {p}:\n            query_string += "&{p}=" + _quote({p})'
+        for p in optional
+    )
+    source = f'''
+async def {name}({signature}) -> Dict:
     try:
-        params = {
-            "url": url
-        }
-        
-        if cursor:
-            params["cursor"] = cursor
-            
-        if sort:
-            params["sort"] = sort
-            
-        return make_api_request("GET", "/question_answers", params, QUORA_HEADERS)
+        cache_key = ({name!r}, {", ".join(all_params)})
+        cached = _TOOL_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        query_string = {required_expr}
+{optional_lines}
+
+        result = await make_api_request("GET", "/{name}", headers=QUORA_HEADERS, query_string=query_string)
+        if result.get("success"):
+            _TOOL_CACHE.set(cache_key, result)
+        return result
     except Exception as e:
-        logger.error(f"Error in question_answers tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
+        logger.error("Error in {name} tool: %s", e)
+        return {{"error": str(e), "exception_type": type(e).__name__}}
+'''
+    namespace = {}
+    exec(compile(source, f"<tool {name}>", "exec"), globals(), namespace)
+    fn = namespace[name]
+    fn.__doc__ = doc
+    return fn
+
+for _spec in _TOOL_SPECS:
+    _fn = _make_tool(*_spec)
+    globals()[_fn.__name__] = _fn
+    mcp.tool()(_fn)
 
-# Tool: Get Comments From Question
+def _extract_question_urls(payload: Any, limit: int) -> List[str]:
+    """Pulls up to `limit` question URLs out of a search_questions payload.
+
+    The API nests results differently across plans, so this accepts either a
+    top-level list or a list under a common wrapper key, and the usual URL
+    field names."""
+    items = None
+    if isinstance(payload, list):
+        items = payload
+    elif isinstance(payload, dict):
+        for key in ("data", "results", "items", "questions"):
+            value = payload.get(key)
+            if isinstance(value, list):
+                items = value
+                break
+    urls: List[str] = []
+    for item in items or ():
+        if not isinstance(item, dict):
+            continue
+        url = item.get("url") or item.get("link") or item.get("question_url")
+        if isinstance(url, str) and url.startswith("http") and url not in urls:
+            urls.append(url)
+            if len(urls) >= limit:
+                break
+    return urls
+
+# Tool: Search Questions and Expand Top Results
 @mcp.tool()
-def question_comments(url: str, cursor: str = None) -> Dict:
-    """Get Comments for a Specific Question
+async def search_and_expand(query: str, language: str, top_k: int = 5) -> Dict:
+    """Search for Questions and Fetch Answers for the Top Results in Parallel
     
     Get Request Parameters:
-    - url: Quora question URL (paramType: STRING, required) (e.g., "https://www.quora.com/Does-China-have-cars")
-    - cursor: Pagination cursor (paramType: STRING, optional)
+    - query: Search query (paramType: STRING, required) (e.g., "cars")
+    - language: Language filter (paramType: ENUM, required)
+    - top_k: How many top questions to expand with their answers (optional, default 5, max 10)
     """
     try:
-        params = {
-            "url": url
+        top_k = max(1, min(int(top_k), 10))
+
+        # The search result has to be inspected here, so ask for a parsed body
+        search = await make_api_request(
+            "GET", "/search_questions",
+            query_string="?query=" + _quote(query) + "&language=" + _quote(language),
+            verbatim=False
+        )
+        if not search.get("success"):
+            return search
+
+        # Expand the top questions concurrently instead of one round trip per
+        # question; each expansion goes through the regular cached tool path
+        urls = _extract_question_urls(search.get("data"), top_k)
+        answers = await asyncio.gather(*(question_answers(url) for url in urls))
+
+        return {
+            "success": True,
+            "status": search.get("status"),
+            "query": query,
+            "questions": search.get("data"),
+            "answers": dict(zip(urls, answers))
         }
-        
-        if cursor:
-            params["cursor"] = cursor
-            
-        return make_api_request("GET", "/question_comments", params, QUORA_HEADERS)
     except Exception as e:
-        logger.error(f"Error in question_comments tool: {str(e)}")
+        logger.error("Error in search_and_expand tool: %s", e)
         return {"error": str(e), "exception_type": type(e).__name__}
 
 